@@ -4,65 +4,99 @@ Cleanup script to remove test artifacts from previous runs.
 Run this BEFORE starting a new test to ensure clean state.
 """
 
+import functools
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# Concurrent delete requests; kept modest to stay under QuickSight throttling
+MAX_WORKERS = 16
+
+# One pooled connection per delete worker, with headroom
+CLIENT_CONFIG = Config(max_pool_connections=32, retries={"mode": "adaptive"})
+
+
+@functools.lru_cache(maxsize=None)
+def _qs(region):
+    """Return the shared QuickSight client for a region."""
+    return boto3.client("quicksight", region_name=region, config=CLIENT_CONFIG)
+
+
+@functools.lru_cache(maxsize=None)
+def _account_id():
+    """Return the caller's AWS account ID (looked up once)."""
+    return boto3.client("sts").get_caller_identity()["Account"]
+
+
+def _delete_analysis(client, account_id, analysis_id):
+    """Delete a single analysis; return False if it was already gone."""
+    try:
+        client.delete_analysis(AwsAccountId=account_id, AnalysisId=analysis_id)
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceNotFoundException':
+            return False
+        raise
+
 
-def cleanup_analyses(prefix, account_id, region):
+def cleanup_analyses(client, prefix, account_id):
     """Delete analyses matching prefix (prevents 5-entity limit errors)."""
-    client = boto3.client("quicksight", region_name=region)
     deleted_count = 0
     
     try:
-        response = client.list_analyses(AwsAccountId=account_id)
-        analyses = response.get('AnalysisSummaryList', [])
-        
-        for analysis in analyses:
-            if analysis['AnalysisId'].startswith(prefix):
-                try:
-                    print(f"  Deleting analysis: {analysis['AnalysisId']}")
-                    client.delete_analysis(
-                        AwsAccountId=account_id,
-                        AnalysisId=analysis['AnalysisId']
-                    )
-                    print(f"    ✓ Deleted")
-                    deleted_count += 1
-                except ClientError as e:
-                    if e.response['Error']['Code'] != 'ResourceNotFoundException':
-                        print(f"    ✗ Error: {e}")
-        
-        if deleted_count == 0:
-            print(f"  No analyses found with prefix '{prefix}' (already clean)")
-        else:
-            print(f"  ✓ Deleted {deleted_count} analyses")
-        
-        return deleted_count
-        
+        paginator = client.get_paginator('list_analyses')
+        analysis_ids = [
+            analysis['AnalysisId']
+            for page in paginator.paginate(AwsAccountId=account_id)
+            for analysis in page.get('AnalysisSummaryList', [])
+            if analysis['AnalysisId'].startswith(prefix)
+        ]
     except Exception as e:
         print(f"  Error listing analyses: {e}")
         return 0
+    
+    # Deletes are independent API calls, so issue them concurrently
+    # using one shared (thread-safe) client
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(_delete_analysis, client, account_id, analysis_id): analysis_id
+            for analysis_id in analysis_ids
+        }
+        for future in as_completed(futures):
+            analysis_id = futures[future]
+            try:
+                deleted = future.result()
+            except Exception as e:
+                print(f"  ✗ Error deleting analysis {analysis_id}: {e}")
+                continue
+            if deleted:
+                print(f"  ✓ Deleted analysis: {analysis_id}")
+                deleted_count += 1
+            else:
+                print(f"  Analysis {analysis_id} not found (already deleted)")
+    
+    if deleted_count == 0:
+        print(f"  No analyses found with prefix '{prefix}' (already clean)")
+    else:
+        print(f"  ✓ Deleted {deleted_count} analyses")
+    
+    return deleted_count
 
 
-def cleanup_dashboard(dashboard_id, account_id, region):
+def cleanup_dashboard(client, dashboard_id, account_id):
     """Delete a dashboard if it exists."""
-    client = boto3.client("quicksight", region_name=region)
     
     try:
-        # Check if dashboard exists
-        client.describe_dashboard(
-            AwsAccountId=account_id,
-            DashboardId=dashboard_id
-        )
-        
-        # Dashboard exists, delete it
-        print(f"  Deleting dashboard: {dashboard_id}")
+        # Delete directly; a missing dashboard surfaces as ResourceNotFoundException
         client.delete_dashboard(
             AwsAccountId=account_id,
             DashboardId=dashboard_id
         )
-        print(f"    ✓ Deleted")
+        print(f"  ✓ Deleted dashboard: {dashboard_id}")
         return True
         
     except ClientError as e:
@@ -70,20 +104,16 @@ def cleanup_dashboard(dashboard_id, account_id, region):
             print(f"  Dashboard {dashboard_id} not found (already clean)")
             return False
         else:
-            print(f"  Error checking dashboard: {e}")
+            print(f"  Error deleting dashboard: {e}")
             return False
 
 
 def main():
     """Clean up test artifacts from previous run."""
-    # Get from environment or use defaults
-    account_id = os.environ.get("AWS_ACCOUNT_ID")
+    # Get from environment or use defaults (STS only when account is unset)
+    account_id = os.environ.get("AWS_ACCOUNT_ID") or _account_id()
     region = os.environ.get("DEV_DOMAIN_REGION", "us-east-2")
-    
-    if not account_id:
-        # Try to get from STS
-        sts = boto3.client("sts")
-        account_id = sts.get_caller_identity()["Account"]
+    client = _qs(region)
     
     print("Cleaning up test artifacts from previous run...")
     print(f"Region: {region}")
@@ -91,11 +121,11 @@ def main():
     
     # Clean up analyses first (critical to prevent 5-entity limit errors)
     print("1. Checking analyses with 'deployed-test' prefix...")
-    cleanup_analyses("deployed-test", account_id, region)
+    cleanup_analyses(client, "deployed-test", account_id)
     
     # Clean up deployed dashboard (from previous deploy)
     print("\n2. Checking deployed dashboard...")
-    cleanup_dashboard("deployed-test-covid-dashboard", account_id, region)
+    cleanup_dashboard(client, "deployed-test-covid-dashboard", account_id)
     
     # Note: We keep test-covid-dashboard as it's the source for export
     print("\n3. Keeping source dashboard: test-covid-dashboard")
@@ -3,7 +3,7 @@
 from .action_registry import registry
 from .executor import BootstrapExecutor
 from .handlers.custom_handler import handle_cli_action
-from .handlers.datazone_handler import handle_datazone_action
+from .handlers.datazone_handler import handle_datazone_action, handle_datazone_actions
 from .handlers.quicksight_handler import handle_quicksight_action
 from .handlers.workflow_create_handler import handle_workflow_create
 from .handlers.workflow_handler import handle_workflow_action
@@ -19,6 +19,10 @@ registry.register("cli", handle_cli_action)
 registry.register("custom", handle_cli_action)  # Backward compatibility
 registry.register("quicksight", handle_quicksight_action)
 
+# Consecutive connection actions share one connection listing and run concurrently
+registry.register_batch("project.create_connection", handle_datazone_actions)
+registry.register_batch("datazone.create_connection", handle_datazone_actions)
+
 # Create global executor
 executor = BootstrapExecutor(registry)
 
@@ -1,6 +1,6 @@
 """Action registry for bootstrap handlers."""
 
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional
 
 from .models import BootstrapAction
 
@@ -10,11 +10,20 @@ class ActionRegistry:
 
     def __init__(self):
         self._handlers: Dict[str, Callable] = {}
+        self._batch_handlers: Dict[str, Callable] = {}
 
     def register(self, service: str, handler: Callable):
         """Register a handler for a service."""
         self._handlers[service] = handler
 
+    def register_batch(self, action_type: str, handler: Callable):
+        """Register a handler that runs consecutive actions of one type together."""
+        self._batch_handlers[action_type] = handler
+
+    def get_batch_handler(self, action_type: str) -> Optional[Callable]:
+        """Get batch handler for action type, if one is registered."""
+        return self._batch_handlers.get(action_type)
+
     def get_handler(self, action_type: str) -> Callable:
         """Get handler for action type."""
         # Check for exact match first (e.g., "workflow.create")
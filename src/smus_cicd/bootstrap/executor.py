@@ -1,6 +1,6 @@
 """Bootstrap action executor."""
 
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from ..helpers.logger import get_logger
 from .action_registry import ActionRegistry
@@ -18,24 +18,69 @@ class BootstrapExecutor:
     def execute_actions(
         self, actions: List[BootstrapAction], context: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
-        """Execute all bootstrap actions sequentially."""
+        """Execute all bootstrap actions sequentially.
+
+        Consecutive actions of a type with a registered batch handler are
+        handed to that handler together so it can run them concurrently.
+        """
         results = []
+        index = 0
+
+        while index < len(actions):
+            action = actions[index]
+            batch_handler = self.registry.get_batch_handler(action.type)
+
+            if batch_handler:
+                end = index
+                while end < len(actions) and actions[end].type == action.type:
+                    end += 1
+                batch = actions[index:end]
+                index = end
 
-        for action in actions:
-            logger.info(f"Executing bootstrap action: {action.type}")
-
-            try:
-                result = self.registry.execute(action, context)
-                results.append(
-                    {"action": action.type, "status": "success", "result": result}
-                )
-                logger.info(f"Successfully executed: {action.type}")
-            except Exception as e:
-                logger.error(f"Failed to execute {action.type}: {e}")
-                results.append(
-                    {"action": action.type, "status": "failed", "error": str(e)}
-                )
-                # Stop on first failure
-                raise
+                if len(batch) > 1:
+                    results.extend(self._execute_batch(batch_handler, batch, context))
+                    continue
+            else:
+                index += 1
+
+            results.append(self._execute_action(action, context))
 
         return results
+
+    def _execute_action(
+        self, action: BootstrapAction, context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute a single action, raising on failure."""
+        logger.info(f"Executing bootstrap action: {action.type}")
+
+        try:
+            result = self.registry.execute(action, context)
+            logger.info(f"Successfully executed: {action.type}")
+            return {"action": action.type, "status": "success", "result": result}
+        except Exception as e:
+            logger.error(f"Failed to execute {action.type}: {e}")
+            # Stop on first failure
+            raise
+
+    def _execute_batch(
+        self,
+        batch_handler: Callable,
+        actions: List[BootstrapAction],
+        context: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """Execute consecutive actions of one type through their batch handler."""
+        action_type = actions[0].type
+        logger.info(f"Executing {len(actions)} bootstrap actions: {action_type}")
+
+        try:
+            batch_results = batch_handler(actions, context)
+        except Exception as e:
+            logger.error(f"Failed to execute {action_type}: {e}")
+            # Stop on first failure
+            raise
+
+        logger.info(f"Successfully executed {len(actions)} actions: {action_type}")
+        return [
+            {"action": action.type, "status": "success", "result": result}
+            for action, result in zip(actions, batch_results)
+        ]
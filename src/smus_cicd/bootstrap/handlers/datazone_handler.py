@@ -1,8 +1,13 @@
 """DataZone bootstrap action handler."""
 
-from typing import Any, Dict
+import functools
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
 
-import boto3
 import typer
 
 from ...helpers import connections, datazone
@@ -12,19 +17,134 @@ from ..models import BootstrapAction
 
 logger = get_logger("bootstrap.handlers.datazone")
 
+# Concurrent connection create/update calls when running a batch of actions
+MAX_CONNECTION_WORKERS = 8
+
+# Marks handle_datazone_actions worker threads, whose output is buffered per action
+_batch_worker = threading.local()
+
+
+@functools.lru_cache(maxsize=None)
+def _connection_creator(domain_id: str, region: str) -> ConnectionCreator:
+    """Get the ConnectionCreator (and its clients) shared across bootstrap actions."""
+    return ConnectionCreator(domain_id=domain_id, region=region)
+
 
 def handle_datazone_action(
     action: BootstrapAction, context: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Handle DataZone/Project actions."""
-    service, api = action.type.split(".", 1)
+    api = action.type.partition(".")[2]
 
-    if api == "create_environment":
-        return create_environment(action, context)
-    elif api == "create_connection":
-        return create_connection(action, context)
-    else:
+    handler = _ACTION_HANDLERS.get(api)
+    if handler is None:
         raise ValueError(f"Unknown DataZone/Project action: {api}")
+    return handler(action, context)
+
+
+def _props_fingerprint(props: Dict[str, Any]) -> str:
+    """Short, key-order independent hash of connection props for debug logs."""
+    canonical = json.dumps(props, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:12]
+
+
+def handle_datazone_actions(
+    actions: List[BootstrapAction], context: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Handle consecutive DataZone/Project actions of the same type concurrently.
+
+    Actions sharing a connection name run in order on one worker, so later ones
+    see what earlier ones created. After the first failure no further actions
+    start; actions already running finish before the error is re-raised.
+    """
+    # List the project's environments and connections, and build the shared
+    # ConnectionCreator, up front so workers only read the shared caches
+    project_info = context.get("metadata", {}).get("project_info", {})
+    project_id = project_info.get("project_id")
+    domain_id = project_info.get("domain_id")
+    if project_id and domain_id:
+        region = context.get("config", {}).get("region")
+        _get_project_environments(context, project_id, domain_id, region)
+        _get_existing_connections(context, project_id, domain_id, region)
+        _connection_creator(domain_id, region)
+
+    # Action indexes grouped by connection name, in action order
+    groups: Dict[Any, List[int]] = {}
+    for index, action in enumerate(actions):
+        key = (action.parameters or {}).get("name") or index
+        groups.setdefault(key, []).append(index)
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(actions)
+    failed = threading.Event()
+
+    def run_group(indexes: List[int]) -> None:
+        _batch_worker.active = True
+        for index in indexes:
+            if failed.is_set():
+                return
+            try:
+                results[index] = handle_datazone_action(actions[index], context)
+            except Exception:
+                failed.set()
+                raise
+
+    max_workers = min(MAX_CONNECTION_WORKERS, len(groups))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_group, indexes) for indexes in groups.values()]
+        wait(futures, return_when=FIRST_EXCEPTION)
+        # Drop groups that haven't started yet
+        for future in futures:
+            future.cancel()
+
+    # Re-raise the first failure in action order
+    for future in futures:
+        if not future.cancelled() and future.exception() is not None:
+            raise future.exception()
+
+    return results
+
+
+def _get_project_environments(
+    context: Dict[str, Any], project_id: str, domain_id: str, region: str
+) -> List[Dict[str, Any]]:
+    """Get project environments, listing them once per project per bootstrap run."""
+    env_cache = context.setdefault("_env_cache", {})
+    key = (project_id, domain_id, region)
+
+    if key not in env_cache:
+        environments = datazone.get_project_environments(project_id, domain_id, region)
+        # Don't cache a failed/empty lookup; a later action may succeed
+        if not environments:
+            return environments
+        env_cache[key] = environments
+
+    return env_cache[key]
+
+
+def _get_existing_connections(
+    context: Dict[str, Any], project_id: str, domain_id: str, region: str
+) -> Dict[str, Dict[str, Any]]:
+    """Get project connections, listing them once per project per bootstrap run."""
+    connection_cache = context.setdefault("_connection_cache", {})
+    key = (project_id, domain_id, region)
+
+    if key not in connection_cache:
+        # Check if connection already exists using the connections helper
+        # This properly checks both project-level and all environment-level connections
+        existing_connections = connections.get_project_connections(
+            project_id, domain_id, region, include_props=True
+        )
+
+        # Check if helper returned an error
+        if "error" in existing_connections:
+            logger.warning(
+                f"Failed to list connections: {existing_connections['error']}"
+            )
+            existing_connections = {}
+
+        connection_cache[key] = existing_connections
+
+    return connection_cache[key]
 
 
 def create_environment(
@@ -43,6 +163,23 @@ def create_connection(
     action: BootstrapAction, context: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Create or update DataZone connection (idempotent)."""
+    if not getattr(_batch_worker, "active", False):
+        return _create_or_update_connection(action, context, typer.echo)
+
+    # In a batch, echo once per action so output from concurrent actions
+    # (including ConnectionCreator's progress lines) doesn't interleave
+    messages: List[str] = []
+    try:
+        return _create_or_update_connection(action, context, messages.append)
+    finally:
+        if messages:
+            typer.echo("\n".join(messages))
+
+
+def _create_or_update_connection(
+    action: BootstrapAction, context: Dict[str, Any], echo: Callable[[str], None]
+) -> Dict[str, Any]:
+    """Create or update a connection, writing user-facing messages with echo."""
     logger.info("Creating DataZone connection")
 
     # Extract context
@@ -68,30 +205,18 @@ def create_connection(
         raise ValueError("Project info not available for connection creation")
 
     # Get project environments
-    environments = datazone.get_project_environments(project_id, domain_id, region)
+    environments = _get_project_environments(context, project_id, domain_id, region)
     if not environments:
         raise ValueError(f"No environments found for project {project_id}")
 
     # Use first environment for creation
     environment_id = environments[0].get("id")
-    datazone_client = boto3.client("datazone", region_name=region)
+    creator = _connection_creator(domain_id, region)
 
-    # Create internal client for WORKFLOWS_SERVERLESS connections
-    internal_client = None
-    if connection_type == "WORKFLOWS_SERVERLESS":
-        internal_client = boto3.client("datazone-internal", region_name=region)
-
-    # Check if connection already exists using the connections helper
-    # This properly checks both project-level and all environment-level connections
-    existing_connections = connections.get_project_connections(
-        project_id, domain_id, region
+    existing_connections = _get_existing_connections(
+        context, project_id, domain_id, region
     )
 
-    # Check if helper returned an error
-    if "error" in existing_connections:
-        logger.warning(f"Failed to list connections: {existing_connections['error']}")
-        existing_connections = {}
-
     logger.info(
         f"DEBUG: get_project_connections returned {len(existing_connections)} connections"
     )
@@ -105,39 +230,48 @@ def create_connection(
         logger.info(f"DEBUG: Found connection '{name}' with ID {connection_id}")
 
         if connection_id:
-            # Get full connection details to find its environment
-            # Use internal client for WORKFLOWS_SERVERLESS connections
-            try:
-                client = internal_client if internal_client else datazone_client
-                detail = client.get_connection(
-                    domainIdentifier=domain_id, identifier=connection_id
-                )
-                existing_connection = detail
-                # Use the environment where the connection exists
-                if detail.get("environmentId"):
-                    environment_id = detail["environmentId"]
-                    logger.info(
-                        f"DEBUG: Connection found in environment {environment_id}"
+            # get_project_connections already fetched the full connection
+            # details, so only fall back to get_connection when they're missing
+            if conn_info.get("props") is not None:
+                existing_connection = conn_info
+            else:
+                # Use internal client for WORKFLOWS_SERVERLESS connections
+                try:
+                    if connection_type == "WORKFLOWS_SERVERLESS":
+                        client = creator._get_internal_datazone_client()
+                    else:
+                        client = creator.client
+                    existing_connection = client.get_connection(
+                        domainIdentifier=domain_id, identifier=connection_id
                     )
-            except Exception as e:
-                logger.warning(f"Failed to get connection details: {e}")
+                except Exception as e:
+                    logger.warning(f"Failed to get connection details: {e}")
+
+            # Use the environment where the connection exists
+            if existing_connection and existing_connection.get("environmentId"):
+                environment_id = existing_connection["environmentId"]
+                logger.info(f"DEBUG: Connection found in environment {environment_id}")
     else:
         logger.info(f"DEBUG: Connection '{name}' NOT found in existing connections")
 
     # Build desired properties
-    creator = ConnectionCreator(domain_id=domain_id, region=region)
     desired_props = creator._build_connection_props(connection_type, **properties)
 
     if existing_connection:
         connection_id = existing_connection["connectionId"]
-        typer.echo(f"🔍 Connection '{name}' exists: {connection_id}")
+        echo(f"🔍 Connection '{name}' exists: {connection_id}")
 
-        # We already have full connection details from get_connection above
+        # Full connection details came from the listing (or get_connection fallback)
         current_props = existing_connection.get("props", {})
 
         # Compare properties
         if current_props == desired_props:
-            typer.echo(f"✓ Connection '{name}' unchanged")
+            echo(f"✓ Connection '{name}' unchanged")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Connection '{name}' props fingerprint "
+                    f"{_props_fingerprint(desired_props)}"
+                )
             return {
                 "action": "datazone.create_connection",
                 "status": "unchanged",
@@ -152,19 +286,25 @@ def create_connection(
                 connection_type=connection_type,
                 props=desired_props,
                 environment_id=environment_id,
+                echo=echo,
             )
+            existing_connections[name] = {
+                "connectionId": connection_id,
+                "environmentId": environment_id,
+                "props": desired_props,
+            }
             return {
                 "action": "datazone.create_connection",
                 "status": "updated",
                 "connection_id": connection_id,
             }
         except Exception as e:
-            typer.echo(f"❌ Failed to update connection '{name}': {e}")
+            echo(f"❌ Failed to update connection '{name}': {e}")
             raise
 
     # Create new connection (either new or MLflow recreate)
     if not existing_connection:
-        typer.echo(
+        echo(
             f"🔗 Creating {connection_type} connection '{name}' in environment {environment_id}"
         )
 
@@ -173,10 +313,16 @@ def create_connection(
                 environment_id=environment_id,
                 name=name,
                 connection_type=connection_type,
+                echo=echo,
                 **properties,
             )
 
-            typer.echo(f"✅ Connection '{name}' created: {connection_id}")
+            echo(f"✅ Connection '{name}' created: {connection_id}")
+            existing_connections[name] = {
+                "connectionId": connection_id,
+                "environmentId": environment_id,
+                "props": desired_props,
+            }
             return {
                 "action": "datazone.create_connection",
                 "status": "created",
@@ -184,5 +330,12 @@ def create_connection(
             }
 
         except Exception as e:
-            typer.echo(f"❌ Failed to create connection '{name}': {e}")
+            echo(f"❌ Failed to create connection '{name}': {e}")
             raise
+
+
+# DataZone/Project API name -> handler, used by handle_datazone_action
+_ACTION_HANDLERS = {
+    "create_environment": create_environment,
+    "create_connection": create_connection,
+}
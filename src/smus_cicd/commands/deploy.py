@@ -1767,7 +1767,11 @@ def _process_bootstrap_actions(
     metadata: Optional[Dict[str, Any]] = None,
 ) -> None:
     """
-    Process bootstrap actions sequentially.
+    Process bootstrap actions in order, stopping at the first failure.
+
+    Consecutive actions with a batch handler (e.g. datazone.create_connection)
+    run concurrently; when one fails, those already running finish before the
+    error is raised.
 
     Args:
         target_config: Target configuration
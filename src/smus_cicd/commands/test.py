@@ -204,6 +204,12 @@ import os
 import pytest
 
 
+def pytest_configure(config):
+    """Register markers used by pipeline tests so they are not reported as unknown."""
+    config.addinivalue_line("markers", "slow: marks tests as slow")
+    config.addinivalue_line("markers", "integration: marks tests as integration tests")
+
+
 @pytest.fixture(scope="session")
 def smus_config():
     """Load SMUS test configuration from JSON file."""
@@ -1,8 +1,53 @@
 """Centralized boto3 client creation helper."""
 
+import functools
+import threading
 from typing import Any, Dict, Optional
 
 import boto3
+from botocore.config import Config
+
+# Client settings for services called many times per run (DataZone bootstrap):
+# reuse warm connections, leave headroom for concurrent bootstrap actions, and
+# back off adaptively when throttled
+CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=60,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_session() -> boto3.Session:
+    """Get the process-wide boto3 session so credentials are resolved once.
+
+    Sessions are not thread-safe; use create_session_client() to build clients
+    from it.
+    """
+    return boto3.Session()
+
+
+# Guards client creation from the shared session across worker threads
+_session_lock = threading.Lock()
+
+
+def create_session_client(service_name: str, region: str, **kwargs):
+    """Create a client from the shared session with CLIENT_CONFIG.
+
+    Safe to call from worker threads; the clients themselves are thread-safe.
+    """
+    with _session_lock:
+        return get_session().client(
+            service_name, region_name=region, config=CLIENT_CONFIG, **kwargs
+        )
+
+
+def get_session_credentials():
+    """Get the shared session's credentials; safe to call from worker threads."""
+    with _session_lock:
+        return get_session().get_credentials()
 
 
 def create_client(
@@ -1,9 +1,14 @@
 """Helper for creating DataZone connections with proper status waiting."""
 
+import threading
 import time
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
-import boto3
+from .boto3_client import (
+    CLIENT_CONFIG,
+    create_session_client,
+    get_session_credentials,
+)
 
 
 class ConnectionCreator:
@@ -12,102 +17,104 @@ class ConnectionCreator:
     def __init__(self, domain_id: str, region: str = "us-east-1"):
         self.domain_id = domain_id
         self.region = region
-        self.client = boto3.client("datazone", region_name=region)
+        self.client = create_session_client("datazone", region)
         self._custom_client = None
         self._internal_client = None
         self._temp_dir = None
+        # Lazily-built clients may be requested from several bootstrap workers
+        self._client_lock = threading.Lock()
 
     def _get_custom_datazone_client(self):
         """Get DataZone client with custom model that supports MLFlow connections."""
-        if self._custom_client is None:
-            import json
-            import os
-            import shutil
-            import tempfile
-            from pathlib import Path
+        with self._client_lock:
+            if self._custom_client is None:
+                import json
+                import os
+                import shutil
+                import tempfile
+                from pathlib import Path
+
+                from botocore.loaders import Loader
+                from botocore.session import Session as BotocoreSession
+
+                # Get the path to the custom DataZone model
+                current_dir = Path(__file__).parent.parent
+                model_path = current_dir / "resources" / "datazone-2018-05-10.json"
+
+                if not model_path.exists():
+                    raise FileNotFoundError(
+                        f"Custom DataZone model not found at {model_path}"
+                    )
 
-            from botocore.loaders import Loader
-            from botocore.session import Session as BotocoreSession
+                # Load the custom model
+                with open(model_path, "r") as f:
+                    service_model_data = json.load(f)
 
-            # Get the path to the custom DataZone model
-            current_dir = Path(__file__).parent.parent
-            model_path = current_dir / "resources" / "datazone-2018-05-10.json"
+                # Create a temporary directory for the custom model
+                temp_dir = tempfile.mkdtemp()
 
-            if not model_path.exists():
-                raise FileNotFoundError(
-                    f"Custom DataZone model not found at {model_path}"
-                )
+                try:
+                    # Create the expected directory structure for botocore
+                    service_dir = os.path.join(temp_dir, "datazone", "2018-05-10")
+                    os.makedirs(service_dir, exist_ok=True)
 
-            # Load the custom model
-            with open(model_path, "r") as f:
-                service_model_data = json.load(f)
+                    # Write the service model
+                    service_file = os.path.join(service_dir, "service-2.json")
+                    with open(service_file, "w") as f:
+                        json.dump(service_model_data, f)
 
-            # Create a temporary directory for the custom model
-            temp_dir = tempfile.mkdtemp()
+                    # Create a custom loader with our model directory
+                    loader = Loader(extra_search_paths=[temp_dir])
 
-            try:
-                # Create the expected directory structure for botocore
-                service_dir = os.path.join(temp_dir, "datazone", "2018-05-10")
-                os.makedirs(service_dir, exist_ok=True)
-
-                # Write the service model
-                service_file = os.path.join(service_dir, "service-2.json")
-                with open(service_file, "w") as f:
-                    json.dump(service_model_data, f)
-
-                # Create a custom loader with our model directory
-                loader = Loader(extra_search_paths=[temp_dir])
-
-                # Create a botocore session with custom loader
-                botocore_session = BotocoreSession()
-                botocore_session.register_component("data_loader", loader)
-
-                # Get credentials from boto3 session
-                boto3_session = boto3.Session()
-                credentials = boto3_session.get_credentials()
-                botocore_session.set_credentials(
-                    access_key=credentials.access_key,
-                    secret_key=credentials.secret_key,
-                    token=credentials.token,
-                )
+                    # Create a botocore session with custom loader
+                    botocore_session = BotocoreSession()
+                    botocore_session.register_component("data_loader", loader)
 
-                # Get endpoint URL
-                endpoint_url = os.environ.get("DATAZONE_ENDPOINT_URL")
+                    # Get credentials from the shared boto3 session
+                    credentials = get_session_credentials()
+                    botocore_session.set_credentials(
+                        access_key=credentials.access_key,
+                        secret_key=credentials.secret_key,
+                        token=credentials.token,
+                    )
 
-                # Create the custom client
-                self._custom_client = botocore_session.create_client(
-                    "datazone",
-                    region_name=self.region,
-                    endpoint_url=endpoint_url,
-                    api_version="2018-05-10",
-                )
+                    # Get endpoint URL
+                    endpoint_url = os.environ.get("DATAZONE_ENDPOINT_URL")
 
-                # Store temp_dir for cleanup later
-                self._temp_dir = temp_dir
+                    # Create the custom client
+                    self._custom_client = botocore_session.create_client(
+                        "datazone",
+                        region_name=self.region,
+                        endpoint_url=endpoint_url,
+                        api_version="2018-05-10",
+                        config=CLIENT_CONFIG,
+                    )
 
-            except Exception as e:
-                # Clean up temp directory on error
-                shutil.rmtree(temp_dir, ignore_errors=True)
-                raise e
+                    # Store temp_dir for cleanup later
+                    self._temp_dir = temp_dir
+
+                except Exception as e:
+                    # Clean up temp directory on error
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    raise e
 
         return self._custom_client
 
     def _get_internal_datazone_client(self):
         """Get DataZone-internal client for workflow connections (WORKFLOWS_MWAA, WORKFLOWS_SERVERLESS)."""
-        if self._internal_client is None:
-            import os
-
-            endpoint_url = os.environ.get("DATAZONE_ENDPOINT_URL")
-            if endpoint_url:
-                self._internal_client = boto3.client(
-                    "datazone-internal",
-                    region_name=self.region,
-                    endpoint_url=endpoint_url,
-                )
-            else:
-                self._internal_client = boto3.client(
-                    "datazone-internal", region_name=self.region
-                )
+        with self._client_lock:
+            if self._internal_client is None:
+                import os
+
+                endpoint_url = os.environ.get("DATAZONE_ENDPOINT_URL")
+                if endpoint_url:
+                    self._internal_client = create_session_client(
+                        "datazone-internal", self.region, endpoint_url=endpoint_url
+                    )
+                else:
+                    self._internal_client = create_session_client(
+                        "datazone-internal", self.region
+                    )
 
         return self._internal_client
 
@@ -145,6 +152,7 @@ class ConnectionCreator:
         name: str,
         connection_type: str,
         description: str = None,
+        echo: Callable[[str], None] = print,
         **kwargs,
     ) -> str:
         """
@@ -155,6 +163,7 @@ class ConnectionCreator:
             name: Connection name
             connection_type: Type of connection (S3, IAM, SPARK_GLUE, etc.)
             description: Optional description
+            echo: Writes progress messages (defaults to print)
             **kwargs: Connection-specific properties
 
         Returns:
@@ -177,6 +186,8 @@ class ConnectionCreator:
             client = self.client
 
         try:
+            # botocore auto-fills clientToken once per call and reuses it across
+            # CLIENT_CONFIG's retries, so a retried create can't duplicate
             response = client.create_connection(
                 domainIdentifier=self.domain_id,
                 environmentIdentifier=environment_id,
@@ -188,7 +199,7 @@ class ConnectionCreator:
             connection_id = response["connectionId"]
 
             # Wait for connection to be ready
-            self._wait_for_connection_ready(connection_id, connection_type)
+            self._wait_for_connection_ready(connection_id, connection_type, echo=echo)
 
             return connection_id
 
@@ -273,7 +284,11 @@ class ConnectionCreator:
             raise ValueError(f"Unsupported connection type: {connection_type}")
 
     def _wait_for_connection_ready(
-        self, connection_id: str, connection_type: str, max_wait: int = 120
+        self,
+        connection_id: str,
+        connection_type: str,
+        max_wait: int = 120,
+        echo: Callable[[str], None] = print,
     ):
         """Wait for connection to be ready."""
         wait_interval = 5
@@ -303,7 +318,7 @@ class ConnectionCreator:
                 elapsed += wait_interval
 
         # Don't fail if timeout - connection might still work
-        print(
+        echo(
             f"Warning: Connection {connection_id} did not become READY within {max_wait}s"
         )
 
@@ -337,9 +352,10 @@ class ConnectionCreator:
         connection_type: str,
         props: Dict[str, Any],
         environment_id: str,
+        echo: Callable[[str], None] = print,
     ) -> str:
-        """Update an existing connection."""
-        print(f"🔄 Updating connection '{name}'")
+        """Update an existing connection, writing progress messages with echo."""
+        echo(f"🔄 Updating connection '{name}'")
 
         try:
             # Determine which client to use based on connection type
@@ -353,7 +369,7 @@ class ConnectionCreator:
             client.update_connection(
                 domainIdentifier=self.domain_id, identifier=connection_id, props=props
             )
-            print(f"✅ Connection '{name}' updated: {connection_id}")
+            echo(f"✅ Connection '{name}' updated: {connection_id}")
             return connection_id
         except Exception as e:
             raise Exception(
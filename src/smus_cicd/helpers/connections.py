@@ -3,8 +3,14 @@
 from typing import Any, Dict
 
 
-def extract_connection_properties(connection_detail: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract type-specific properties from a DataZone connection."""
+def extract_connection_properties(
+    connection_detail: Dict[str, Any], include_props: bool = False
+) -> Dict[str, Any]:
+    """Extract type-specific properties from a DataZone connection.
+
+    Set include_props to also keep the raw props, for callers that compare
+    against desired state; they are left out of the public connection info.
+    """
     connection_type = connection_detail.get("type", "")
     props = connection_detail.get("props", {})
 
@@ -16,6 +22,8 @@ def extract_connection_properties(connection_detail: Dict[str, Any]) -> Dict[str
         "environmentId": connection_detail.get("environmentId", ""),
         "physicalEndpoints": connection_detail.get("physicalEndpoints", []),
     }
+    if include_props:
+        conn_info["props"] = props
 
     # Extract AWS location info from physicalEndpoints for display
     physical_endpoints = connection_detail.get("physicalEndpoints", [])
@@ -99,7 +107,7 @@ def extract_connection_properties(connection_detail: Dict[str, Any]) -> Dict[str
 
 
 def get_project_connections(
-    project_id: str, domain_id: str, region: str
+    project_id: str, domain_id: str, region: str, include_props: bool = False
 ) -> Dict[str, Dict[str, Any]]:
     """Get all connections for a DataZone project with extracted properties."""
     from . import datazone
@@ -148,7 +156,9 @@ def get_project_connections(
                     connection_detail["project_id"] = project_id
 
                     # Extract properties using centralized logic
-                    conn_info = extract_connection_properties(connection_detail)
+                    conn_info = extract_connection_properties(
+                        connection_detail, include_props
+                    )
                     connections[conn_name] = conn_info
 
                 except Exception as e:
@@ -213,7 +223,7 @@ def get_project_connections(
 
                                     # Extract properties using centralized logic
                                     conn_info = extract_connection_properties(
-                                        connection_detail
+                                        connection_detail, include_props
                                     )
                                     connections[conn_name] = conn_info
 
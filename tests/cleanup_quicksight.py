@@ -1,58 +1,92 @@
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+
 import boto3
 from botocore.exceptions import ClientError
 
+from smus_cicd.helpers.boto3_client import CLIENT_CONFIG
+
+# Deletes are independent round-trips; cap concurrency to avoid QuickSight throttling
+MAX_WORKERS = 16
+
+# Comma-separated ID prefixes of resources created by the tests
+PREFIXES = [p.strip() for p in os.environ.get('CLEANUP_PREFIXES', 'deployed-test').split(',') if p.strip()]
+if not PREFIXES:
+    # An empty pattern would match, and delete, every resource in the account
+    sys.exit("✗ CLEANUP_PREFIXES must name at least one ID prefix")
+matches_prefix = re.compile('^(' + '|'.join(re.escape(p) for p in PREFIXES) + ')').match
+
 region = os.environ.get('AWS_REGION', os.environ.get('DOMAIN_REGION', 'us-east-2'))
+# One session so both clients share a single credential resolution
+session = boto3.Session()
+
 # Get account ID from STS
-sts = boto3.client('sts')
+sts = session.client('sts', config=CLIENT_CONFIG)
 account_id = sts.get_caller_identity()['Account']
 
-qs = boto3.client('quicksight', region_name=region)
+qs = session.client('quicksight', region_name=region, config=CLIENT_CONFIG)
 
 print(f"Cleaning up QuickSight resources in account {account_id}, region {region}")
+print(f"Prefixes: {', '.join(PREFIXES)}")
 
-# Delete analyses starting with "deployed-test" (prevents 5-entity limit errors)
-try:
-    analyses = qs.list_analyses(AwsAccountId=account_id)['AnalysisSummaryList']
-    for analysis in analyses:
-        if analysis['AnalysisId'].startswith('deployed-test'):
+
+def iter_cleanup_ids(operation, list_key, id_key):
+    """Yield IDs starting with a cleanup prefix across every page of a list_* call."""
+    paginator = qs.get_paginator(operation)
+    get_id = itemgetter(id_key)
+    for page in paginator.paginate(AwsAccountId=account_id):
+        yield from filter(matches_prefix, map(get_id, page.get(list_key, [])))
+
+
+def parallel_delete(resource_ids, id_key, delete_fn, label):
+    """Delete the given resources concurrently."""
+    # Finish paginating first so deletes can't shift items across later pages
+    resource_ids = list(resource_ids)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(delete_fn, AwsAccountId=account_id, **{id_key: resource_id}): resource_id
+            for resource_id in resource_ids
+        }
+        for future in as_completed(futures):
+            resource_id = futures[future]
             try:
-                qs.delete_analysis(AwsAccountId=account_id, AnalysisId=analysis['AnalysisId'])
-                print(f"✓ Deleted analysis: {analysis['AnalysisId']}")
+                future.result()
+                print(f"✓ Deleted {label}: {resource_id}")
             except ClientError as e:
                 if e.response['Error']['Code'] != 'ResourceNotFoundException':
-                    print(f"✗ Error deleting analysis {analysis['AnalysisId']}: {e}")
+                    print(f"✗ Error deleting {label} {resource_id}: {e}")
+            except Exception as e:
+                print(f"✗ Error deleting {label} {resource_id}: {e}")
+
+
+# Delete matching analyses (prevents 5-entity limit errors)
+try:
+    parallel_delete(
+        iter_cleanup_ids('list_analyses', 'AnalysisSummaryList', 'AnalysisId'),
+        'AnalysisId', qs.delete_analysis, 'analysis',
+    )
 except Exception as e:
     print(f"✗ Error listing analyses: {e}")
 
-# Delete dashboards starting with "deployed-test"
-dashboards = qs.list_dashboards(AwsAccountId=account_id)['DashboardSummaryList']
-for dash in dashboards:
-    if dash['DashboardId'].startswith('deployed-test'):
-        try:
-            qs.delete_dashboard(AwsAccountId=account_id, DashboardId=dash['DashboardId'])
-            print(f"✓ Deleted dashboard: {dash['DashboardId']}")
-        except Exception as e:
-            print(f"✗ Error deleting dashboard {dash['DashboardId']}: {e}")
-
-# Delete datasets starting with "deployed-test"
-datasets = qs.list_data_sets(AwsAccountId=account_id)['DataSetSummaries']
-for ds in datasets:
-    if ds['DataSetId'].startswith('deployed-test'):
-        try:
-            qs.delete_data_set(AwsAccountId=account_id, DataSetId=ds['DataSetId'])
-            print(f"✓ Deleted dataset: {ds['DataSetId']}")
-        except Exception as e:
-            print(f"✗ Error deleting dataset {ds['DataSetId']}: {e}")
-
-# Delete data sources starting with "deployed-test"
-sources = qs.list_data_sources(AwsAccountId=account_id)['DataSources']
-for src in sources:
-    if src['DataSourceId'].startswith('deployed-test'):
-        try:
-            qs.delete_data_source(AwsAccountId=account_id, DataSourceId=src['DataSourceId'])
-            print(f"✓ Deleted data source: {src['DataSourceId']}")
-        except Exception as e:
-            print(f"✗ Error deleting data source {src['DataSourceId']}: {e}")
+# Delete matching dashboards
+parallel_delete(
+    iter_cleanup_ids('list_dashboards', 'DashboardSummaryList', 'DashboardId'),
+    'DashboardId', qs.delete_dashboard, 'dashboard',
+)
+
+# Delete matching datasets
+parallel_delete(
+    iter_cleanup_ids('list_data_sets', 'DataSetSummaries', 'DataSetId'),
+    'DataSetId', qs.delete_data_set, 'dataset',
+)
+
+# Delete matching data sources
+parallel_delete(
+    iter_cleanup_ids('list_data_sources', 'DataSources', 'DataSourceId'),
+    'DataSourceId', qs.delete_data_source, 'data source',
+)
 
 print("✓ Cleanup complete")
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from typer.testing import CliRunner
 from smus_cicd.cli import app
+from smus_cicd.helpers.boto3_client import CLIENT_CONFIG, get_session
 
 
 class IntegrationTestBase:
@@ -228,6 +229,10 @@ class IntegrationTestBase:
         if aws_config.get("region"):
             os.environ["AWS_DEFAULT_REGION"] = aws_config["region"]
 
+        # Process-wide session, so credentials are resolved once per run
+        # rather than once per client in every test's setup
+        self.aws_session = get_session()
+
         # Verify AWS credentials are available before proceeding
         self._verify_aws_credentials()
 
@@ -237,10 +242,10 @@ class IntegrationTestBase:
     def _verify_aws_credentials(self):
         """Verify AWS credentials are available and fail fast if not."""
         try:
-            import boto3
-
-            sts_client = boto3.client(
-                "sts", region_name=self.config.get("aws", {}).get("region", "us-east-1")
+            sts_client = self.aws_session.client(
+                "sts",
+                region_name=self.config.get("aws", {}).get("region", "us-east-1"),
+                config=CLIENT_CONFIG,
             )
             identity = sts_client.get_caller_identity()
             print(f"✅ AWS credentials verified: {identity['Arn']}")
@@ -254,14 +259,12 @@ class IntegrationTestBase:
     def setup_lake_formation_admin(self):
         """Ensure current role is a Lake Formation admin (idempotent)."""
         try:
-            import boto3
-
-            lf_client = boto3.client(
-                "lakeformation",
-                region_name=self.config.get("aws", {}).get("region", "us-east-1"),
+            region = self.config.get("aws", {}).get("region", "us-east-1")
+            lf_client = self.aws_session.client(
+                "lakeformation", region_name=region, config=CLIENT_CONFIG
             )
-            sts_client = boto3.client(
-                "sts", region_name=self.config.get("aws", {}).get("region", "us-east-1")
+            sts_client = self.aws_session.client(
+                "sts", region_name=region, config=CLIENT_CONFIG
             )
 
             # Get current identity
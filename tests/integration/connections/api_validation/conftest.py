@@ -0,0 +1,57 @@
+"""Shared fixtures for DataZone connection API validation tests."""
+
+import os
+
+import boto3
+import pytest
+
+from smus_cicd.helpers.boto3_client import CLIENT_CONFIG
+
+
+def _require_env(name):
+    """Return an environment variable or skip when it is not set."""
+    value = os.environ.get(name)
+    if not value:
+        pytest.skip(
+            "DATAZONE_DOMAIN_ID and DATAZONE_PROJECT_ID_DEV environment variables required"
+        )
+    return value
+
+
+@pytest.fixture(scope="session")
+def region():
+    """AWS region for the DataZone client."""
+    return os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
+
+
+@pytest.fixture(scope="session")
+def domain_id():
+    """DataZone domain under test."""
+    return _require_env("DATAZONE_DOMAIN_ID")
+
+
+@pytest.fixture(scope="session")
+def project_id():
+    """DataZone project under test."""
+    return _require_env("DATAZONE_PROJECT_ID_DEV")
+
+
+@pytest.fixture(scope="session")
+def datazone_client(region):
+    """DataZone client shared by every test in the session."""
+    return boto3.client("datazone", region_name=region, config=CLIENT_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def env_id(datazone_client, domain_id, project_id):
+    """ID of the project's first environment, looked up once per session."""
+    try:
+        env_response = datazone_client.list_environments(
+            domainIdentifier=domain_id, projectIdentifier=project_id, maxResults=1
+        )
+    except Exception as e:
+        pytest.skip(f"Could not list environments: {e}")
+    environments = env_response.get("items", [])
+    if not environments:
+        pytest.skip(f"No environments found for project {project_id}")
+    return environments[0]["id"]
@@ -0,0 +1,64 @@
+"""Helpers for sweeping test connections left behind by earlier runs.
+
+Kept next to the tests (not in tests/integration/base.py) so the scripts in
+this folder still run directly with ``python <script>.py``.
+"""
+
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# Connections younger than this may belong to a run that is still in progress
+STALE_AFTER_SECONDS = 3600
+
+
+def stamped_name(prefix):
+    """Return a unique connection name that records its creation time."""
+    return f"{prefix}-{int(time.time())}-{uuid.uuid4().hex[:8]}"
+
+
+def find_stale_connections(
+    client, domain_id, project_id, prefix, max_age=STALE_AFTER_SECONDS
+):
+    """Return {connectionId: name} for prefix connections older than max_age.
+
+    ListConnections has no creation time, so the age comes from names built by
+    stamped_name() (or the older ``<prefix>-<epoch>`` form). A name that is just
+    the prefix predates stamping and is always stale. Other names are skipped.
+    """
+    stamp = re.compile(re.escape(prefix) + r"(?:-(\d{10})(?:-.*)?)?")
+    cutoff = time.time() - max_age
+    paginator = client.get_paginator("list_connections")
+    pages = paginator.paginate(domainIdentifier=domain_id, projectIdentifier=project_id)
+    stale = {}
+    for connection_id, name in pages.search(
+        f"items[?starts_with(name, '{prefix}')].[connectionId, name] || `[]`"
+    ):
+        match = stamp.fullmatch(name)
+        if match and (match.group(1) is None or int(match.group(1)) < cutoff):
+            stale[connection_id] = name
+    return stale
+
+
+def delete_connections(client, domain_id, connection_ids):
+    """Delete DataZone connections concurrently.
+
+    Returns a dict mapping each connection ID to the exception raised while
+    deleting it, or None on success.
+    """
+
+    def _delete(connection_id):
+        try:
+            client.delete_connection(
+                domainIdentifier=domain_id, identifier=connection_id
+            )
+        except Exception as e:
+            return e
+        return None
+
+    connection_ids = list(connection_ids)
+    if not connection_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(16, len(connection_ids))) as executor:
+        return dict(zip(connection_ids, executor.map(_delete, connection_ids)))
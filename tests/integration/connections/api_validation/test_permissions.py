@@ -1,36 +1,18 @@
 #!/usr/bin/env python3
 
-import boto3
 import json
-import os
+import sys
 import pytest
 
-def test_permissions():
+from connection_cleanup import (
+    delete_connections,
+    find_stale_connections,
+    stamped_name,
+)
+
+def test_permissions(region, domain_id, project_id, datazone_client, env_id):
     """Test basic DataZone permissions before attempting connection creation"""
-    
-    # Get configuration from environment variables
-    region = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
-    domain_id = os.environ.get('DATAZONE_DOMAIN_ID')
-    project_id = os.environ.get('DATAZONE_PROJECT_ID_DEV')
-    
-    if not domain_id or not project_id:
-        pytest.skip("DATAZONE_DOMAIN_ID and DATAZONE_PROJECT_ID_DEV environment variables required")
-    
-    client = boto3.client('datazone', region_name=region)
-    
-    # Get first environment from the project
-    try:
-        env_response = client.list_environments(
-            domainIdentifier=domain_id,
-            projectIdentifier=project_id,
-            maxResults=1
-        )
-        environments = env_response.get('items', [])
-        if not environments:
-            pytest.skip(f"No environments found for project {project_id}")
-        env_id = environments[0]['id']
-    except Exception as e:
-        pytest.skip(f"Could not list environments: {e}")
+    client = datazone_client
     
     print("Testing DataZone permissions...")
     print(f"Region: {region}")
@@ -58,26 +40,20 @@ def test_permissions():
     
     # Test 2: Try simple S3 connection creation
     print(f"\nTesting S3 connection creation...")
+    # Unique per run so parallel workers/jobs don't collide on the name
+    connection_name = stamped_name('test-s3-permission-check')
     
-    # First, clean up any existing test connections
+    # First, clean up test connections left by earlier runs (old enough that
+    # no concurrent run can still be using them)
     try:
-        response = client.list_connections(
-            domainIdentifier=domain_id,
-            projectIdentifier=project_id
+        stale = find_stale_connections(
+            client, domain_id, project_id, 'test-s3-permission-check'
         )
-        for conn in response.get('items', []):
-            if conn['name'].startswith('test-s3-permission-check'):
-                try:
-                    # Use 'id' field instead of 'connectionId' for identifier
-                    conn_id = conn.get('connectionId') or conn.get('id')
-                    if conn_id:
-                        client.delete_connection(
-                            domainIdentifier=domain_id,
-                            identifier=conn_id
-                        )
-                        print(f"🧹 Cleaned up old test connection: {conn['name']} ({conn_id})")
-                except Exception as e:
-                    print(f"⚠️ Cleanup failed for {conn['name']}: {e}")
+        for conn_id, error in delete_connections(client, domain_id, stale).items():
+            if error:
+                print(f"⚠️ Cleanup failed for {stale[conn_id]}: {error}")
+            else:
+                print(f"🧹 Cleaned up old test connection: {stale[conn_id]} ({conn_id})")
     except Exception as e:
         print(f"⚠️ Cleanup listing failed: {e}")
     
@@ -86,7 +62,7 @@ def test_permissions():
         response = client.create_connection(
             domainIdentifier=domain_id,
             environmentIdentifier=env_id,
-            name="test-s3-permission-check",
+            name=connection_name,
             description="Permission test",
             props={
                 "s3Properties": {
@@ -111,7 +87,7 @@ def test_permissions():
                 projectIdentifier=project_id
             )
             for conn in response.get('items', []):
-                if conn['name'] == 'test-s3-permission-check':
+                if conn['name'] == connection_name:
                     connection_id = conn.get('connectionId') or conn.get('id')
                     print(f"✅ Using existing connection: {connection_id}")
                     break
@@ -145,8 +121,5 @@ def test_permissions():
                 print(f"   ⚠️ Cleanup warning: {e}")
 
 if __name__ == "__main__":
-    success = test_permissions()
-    if success:
-        print(f"\n🎉 Permissions verified - ready to test all connection types")
-    else:
-        print(f"\n💥 Permission issues detected - need to resolve before proceeding")
+    # Fixtures come from conftest.py, so run through pytest
+    sys.exit(pytest.main([__file__, "-s"]))
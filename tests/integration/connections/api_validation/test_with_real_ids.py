@@ -1,36 +1,13 @@
 #!/usr/bin/env python3
 
-import boto3
-import time
-import os
+import sys
 import pytest
 
-def test_s3_connection():
+from connection_cleanup import delete_connections, find_stale_connections, stamped_name
+
+def test_s3_connection(region, domain_id, project_id, datazone_client, env_id):
     """Test S3 connection creation with real IDs"""
-    
-    # Get configuration from environment variables
-    region = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
-    domain_id = os.environ.get('DATAZONE_DOMAIN_ID')
-    project_id = os.environ.get('DATAZONE_PROJECT_ID_DEV')
-    
-    if not domain_id or not project_id:
-        pytest.skip("DATAZONE_DOMAIN_ID and DATAZONE_PROJECT_ID_DEV environment variables required")
-    
-    client = boto3.client('datazone', region_name=region)
-    
-    # Get first environment from the project
-    try:
-        env_response = client.list_environments(
-            domainIdentifier=domain_id,
-            projectIdentifier=project_id,
-            maxResults=1
-        )
-        environments = env_response.get('items', [])
-        if not environments:
-            pytest.skip(f"No environments found for project {project_id}")
-        env_id = environments[0]['id']
-    except Exception as e:
-        pytest.skip(f"Could not list environments: {e}")
+    client = datazone_client
     
     print("Testing S3 connection creation...")
     print(f"Region: {region}")
@@ -39,22 +16,14 @@ def test_s3_connection():
     print(f"Environment: {env_id}")
     print("=" * 50)
     
-    # First, clean up any existing test connections
+    # First, clean up test connections left by earlier runs, including the
+    # older test-s3-<epoch> names (only ones past the age threshold, so
+    # parallel workers don't delete each other's connections)
     try:
-        response = client.list_connections(
-            domainIdentifier=domain_id,
-            projectIdentifier=project_id
-        )
-        for conn in response.get('items', []):
-            if conn['name'].startswith('test-s3-'):
-                try:
-                    client.delete_connection(
-                        domainIdentifier=domain_id,
-                        identifier=conn['connectionId']
-                    )
-                    print(f"🧹 Cleaned up old test connection: {conn['name']}")
-                except Exception:
-                    pass  # Ignore cleanup errors
+        stale = find_stale_connections(client, domain_id, project_id, 'test-s3')
+        for conn_id, error in delete_connections(client, domain_id, stale).items():
+            if not error:  # Ignore cleanup errors
+                print(f"🧹 Cleaned up old test connection: {stale[conn_id]}")
     except Exception:
         pass  # Ignore cleanup errors
     
@@ -63,7 +32,7 @@ def test_s3_connection():
         response = client.create_connection(
             domainIdentifier=domain_id,
             environmentIdentifier=env_id,
-            name=f"test-s3-{int(time.time())}",
+            name=stamped_name("test-s3"),
             description="Test S3 connection",
             props={
                 "s3Properties": {
@@ -92,5 +61,5 @@ def test_s3_connection():
                 print(f"⚠️ Cleanup warning: {e}")
 
 if __name__ == "__main__":
-    test_s3_connection()
-    print("\n🎉 Ready to test all connection types!")
+    # Fixtures come from conftest.py, so run through pytest
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -1,43 +1,70 @@
-"""Integration tests for pipeline project validation."""
+"""Integration tests for pipeline project validation.
+
+Every assertion here carries its own message, so pytest's assertion rewriting
+is skipped for this module: PYTEST_DONT_REWRITE
+"""
 
 import os
+import re
+from types import SimpleNamespace
+
+import boto3
 import pytest
+from botocore.exceptions import ClientError
+
+# Standard deployment stages accepted for SMUS_TARGET_NAME
+VALID_STAGES = frozenset({'dev', 'test', 'prod', 'DEV', 'TEST', 'PROD'})
+
+# Alphanumerics plus '-' and '_' separators
+ID_PATTERN = re.compile(r'[A-Za-z0-9_-]+')
+
+
+@pytest.fixture(scope="module")
+def smus_env():
+    """SMUS_* variables set by the CLI test command, read once per module."""
+    return SimpleNamespace(
+        domain_id=os.environ.get('SMUS_DOMAIN_ID'),
+        domain_name=os.environ.get('SMUS_DOMAIN_NAME'),
+        region=os.environ.get('SMUS_REGION'),
+        project_id=os.environ.get('SMUS_PROJECT_ID'),
+        project_name=os.environ.get('SMUS_PROJECT_NAME'),
+        target_name=os.environ.get('SMUS_TARGET_NAME'),
+    )
 
 
-def test_environment_variables_available():
+@pytest.fixture(scope="module")
+def aws_session():
+    """Shared boto3 session; skips when no credentials resolve locally."""
+    session = boto3.Session()
+    if session.get_credentials() is None:
+        pytest.skip("No AWS credentials configured")
+    return session
+
+
+def test_environment_variables_available(smus_env):
     """Test that required environment variables are available during test execution."""
     # These environment variables are set by the SMUS CLI test command
     # when running tests in the context of a deployed project
     
-    # Check for domain context
-    domain_id = os.environ.get('SMUS_DOMAIN_ID')
-    domain_name = os.environ.get('SMUS_DOMAIN_NAME')
-    region = os.environ.get('SMUS_REGION')
-    
-    # Check for project context
-    project_id = os.environ.get('SMUS_PROJECT_ID')
-    project_name = os.environ.get('SMUS_PROJECT_NAME')
-    target_name = os.environ.get('SMUS_TARGET_NAME')
-    
     print("\n=== SMUS Test Environment ===")
-    print(f"Domain ID: {domain_id}")
-    print(f"Domain Name: {domain_name}")
-    print(f"Region: {region}")
-    print(f"Project ID: {project_id}")
-    print(f"Project Name: {project_name}")
-    print(f"Target: {target_name}")
+    print(f"Domain ID: {smus_env.domain_id}")
+    print(f"Domain Name: {smus_env.domain_name}")
+    print(f"Region: {smus_env.region}")
+    print(f"Project ID: {smus_env.project_id}")
+    print(f"Project Name: {smus_env.project_name}")
+    print(f"Target: {smus_env.target_name}")
     print("============================\n")
     
     # Basic validation - at least project context should be available
     # Domain context may not be available in all environments
-    assert project_id or project_name, "Project context should be available"
-    assert region, "Region should be available"
+    assert smus_env.project_id or smus_env.project_name, "Project context should be available"
+    assert smus_env.region, "Region should be available"
 
 
-def test_project_context():
+def test_project_context(smus_env):
     """Test that project context information is valid."""
-    project_name = os.environ.get('SMUS_PROJECT_NAME')
-    target_name = os.environ.get('SMUS_TARGET_NAME')
+    project_name = smus_env.project_name
+    target_name = smus_env.target_name
     
     if project_name:
         # Project name should be reasonable length
@@ -46,14 +73,14 @@ def test_project_context():
     
     if target_name:
         # Target name should be one of the standard stages
-        assert target_name in ['dev', 'test', 'prod', 'DEV', 'TEST', 'PROD'], \
+        assert target_name in VALID_STAGES, \
             f"Target name '{target_name}' should be a valid stage"
 
 
-def test_domain_and_project_ids():
+def test_domain_and_project_ids(smus_env):
     """Test that domain and project IDs are in expected format."""
-    domain_id = os.environ.get('SMUS_DOMAIN_ID')
-    project_id = os.environ.get('SMUS_PROJECT_ID')
+    domain_id = smus_env.domain_id
+    project_id = smus_env.project_id
     
     if domain_id:
         # DataZone domain IDs typically start with 'dzd-'
@@ -63,22 +90,19 @@ def test_domain_and_project_ids():
     if project_id:
         # DataZone project IDs are alphanumeric
         assert len(project_id) > 0, "Project ID should not be empty"
-        assert project_id.replace('-', '').replace('_', '').isalnum(), \
+        assert ID_PATTERN.fullmatch(project_id), \
             "Project ID should be alphanumeric"
         print(f"Project ID format: {project_id}")
 
 
 @pytest.mark.slow
-def test_aws_connectivity():
+def test_aws_connectivity(smus_env, aws_session):
     """Test AWS connectivity (marked as slow test)."""
-    import boto3
-    from botocore.exceptions import ClientError
-    
-    region = os.environ.get('SMUS_REGION', 'us-east-1')
+    region = smus_env.region or 'us-east-1'
     
     try:
         # Test basic AWS connectivity
-        sts = boto3.client('sts', region_name=region)
+        sts = aws_session.client('sts', region_name=region)
         identity = sts.get_caller_identity()
         
         assert 'Account' in identity, "Should be able to get AWS account info"
@@ -88,10 +112,10 @@ def test_aws_connectivity():
         print(f"✅ AWS Identity: {identity['Arn']}")
         
         # Test DataZone connectivity if domain ID is available
-        domain_id = os.environ.get('SMUS_DOMAIN_ID')
+        domain_id = smus_env.domain_id
         if domain_id:
             try:
-                datazone = boto3.client('datazone', region_name=region)
+                datazone = aws_session.client('datazone', region_name=region)
                 domain = datazone.get_domain(identifier=domain_id)
                 print(f"✅ DataZone domain accessible: {domain['name']}")
             except ClientError as e:
@@ -1,8 +1,13 @@
 """Unit tests for bootstrap module."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
 from smus_cicd.bootstrap import BootstrapAction, BootstrapConfig, executor, registry
+from smus_cicd.bootstrap.action_registry import ActionRegistry
+from smus_cicd.bootstrap.executor import BootstrapExecutor
+from smus_cicd.bootstrap.handlers.custom_handler import handle_cli_action
 
 
 class TestBootstrapAction:
@@ -109,6 +114,65 @@ class TestBootstrapExecutor:
         with pytest.raises(ValueError):
             executor.execute_actions(actions, context)
 
+    def test_execute_batches_consecutive_actions(self):
+        """Test that consecutive actions with a batch handler run together."""
+        local_registry = ActionRegistry()
+        local_registry.register("cli", handle_cli_action)
+        batch_handler = MagicMock(
+            side_effect=lambda actions, ctx: [
+                {"message": a.parameters["message"]} for a in actions
+            ]
+        )
+        local_registry.register_batch("cli.notify", batch_handler)
+        actions = [
+            BootstrapAction(type="cli.notify", parameters={"message": "First"}),
+            BootstrapAction(type="cli.notify", parameters={"message": "Second"}),
+            BootstrapAction(type="cli.print", parameters={"message": "Third"}),
+        ]
+
+        results = BootstrapExecutor(local_registry).execute_actions(actions, {})
+
+        batch_handler.assert_called_once_with(actions[:2], {})
+        assert [r["action"] for r in results] == [
+            "cli.notify",
+            "cli.notify",
+            "cli.print",
+        ]
+        assert results[1]["result"]["message"] == "Second"
+        assert results[2]["result"]["message"] == "Third"
+
+    def test_batch_failure_stops_later_actions(self):
+        """Test that a batch handler's exception stops the remaining actions."""
+        cli_handler = MagicMock()
+        local_registry = ActionRegistry()
+        local_registry.register("cli", cli_handler)
+        local_registry.register_batch(
+            "cli.notify", MagicMock(side_effect=RuntimeError("boom"))
+        )
+        actions = [
+            BootstrapAction(type="cli.notify", parameters={"message": "First"}),
+            BootstrapAction(type="cli.notify", parameters={"message": "Second"}),
+            BootstrapAction(type="cli.print", parameters={"message": "Third"}),
+        ]
+
+        with pytest.raises(RuntimeError, match="boom"):
+            BootstrapExecutor(local_registry).execute_actions(actions, {})
+
+        cli_handler.assert_not_called()
+
+    def test_single_batch_type_action_uses_registry(self):
+        """Test that a lone action of a batch-registered type runs on its own."""
+        local_registry = ActionRegistry()
+        local_registry.register("cli", handle_cli_action)
+        batch_handler = MagicMock()
+        local_registry.register_batch("cli.print", batch_handler)
+        actions = [BootstrapAction(type="cli.print", parameters={"message": "Only"})]
+
+        results = BootstrapExecutor(local_registry).execute_actions(actions, {})
+
+        batch_handler.assert_not_called()
+        assert results[0]["result"]["message"] == "Only"
+
 
 class TestCustomHandler:
     """Test custom action handler."""
@@ -0,0 +1,375 @@
+"""Unit tests for DataZone bootstrap connection handler."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from smus_cicd.bootstrap.handlers import datazone_handler
+from smus_cicd.bootstrap.models import BootstrapAction
+from smus_cicd.helpers import connection_creator
+
+S3_PROPS = {"s3Properties": {"s3Uri": "s3://bucket/data/"}}
+
+
+def s3_actions(*names):
+    """Build S3 create_connection actions, one per connection name."""
+    return [
+        BootstrapAction(
+            type="datazone.create_connection",
+            parameters={"name": name, "connection_type": "S3"},
+        )
+        for name in names
+    ]
+
+
+@pytest.fixture
+def context():
+    """Bootstrap execution context with project info."""
+    return {
+        "config": {"region": "us-east-1"},
+        "metadata": {
+            "project_info": {"project_id": "project-123", "domain_id": "domain-123"}
+        },
+    }
+
+
+@pytest.fixture
+def action():
+    """S3 create_connection bootstrap action."""
+    return BootstrapAction(
+        type="datazone.create_connection",
+        parameters={
+            "name": "my-s3",
+            "connection_type": "S3",
+            "properties": {"s3_uri": "s3://bucket/data/"},
+        },
+    )
+
+
+@pytest.fixture
+def aws():
+    """Patch DataZone helpers and the cached ConnectionCreator."""
+    creator = MagicMock()
+    creator._build_connection_props.return_value = S3_PROPS
+    with patch.object(
+        datazone_handler.datazone,
+        "get_project_environments",
+        return_value=[{"id": "env-1"}],
+    ), patch.object(
+        datazone_handler.connections, "get_project_connections"
+    ) as mock_conns, patch.object(
+        datazone_handler, "_connection_creator", return_value=creator
+    ):
+        yield SimpleNamespace(conns=mock_conns, creator=creator, client=creator.client)
+
+
+class TestCreateConnection:
+    """Tests for create_connection idempotency."""
+
+    def test_existing_connection_unchanged_skips_get_connection(
+        self, action, context, aws
+    ):
+        """Test an unchanged listed connection is reused without get_connection."""
+        aws.conns.return_value = {
+            "my-s3": {
+                "connectionId": "conn-1",
+                "environmentId": "env-2",
+                "props": S3_PROPS,
+            }
+        }
+
+        result = datazone_handler.create_connection(action, context)
+
+        assert result["status"] == "unchanged"
+        assert result["connection_id"] == "conn-1"
+        aws.client.get_connection.assert_not_called()
+
+    def test_existing_connection_updated_in_its_environment(self, action, context, aws):
+        """Test a changed connection is updated in the environment it lives in."""
+        aws.conns.return_value = {
+            "my-s3": {
+                "connectionId": "conn-1",
+                "environmentId": "env-2",
+                "props": {"s3Properties": {"s3Uri": "s3://old/"}},
+            }
+        }
+        aws.creator.update_connection.return_value = "conn-1"
+
+        result = datazone_handler.create_connection(action, context)
+
+        assert result["status"] == "updated"
+        assert aws.creator.update_connection.call_args.kwargs["environment_id"] == (
+            "env-2"
+        )
+
+    def test_numeric_props_compare_by_value(self, action, context, aws):
+        """Test props that differ only as int vs float are unchanged."""
+        aws.creator._build_connection_props.return_value = {
+            "sparkGlueProperties": {"numberOfWorkers": 10}
+        }
+        aws.conns.return_value = {
+            "my-s3": {
+                "connectionId": "conn-1",
+                "props": {"sparkGlueProperties": {"numberOfWorkers": 10.0}},
+            }
+        }
+
+        result = datazone_handler.create_connection(action, context)
+
+        assert result["status"] == "unchanged"
+        aws.creator.update_connection.assert_not_called()
+
+    def test_falls_back_to_get_connection_without_props(self, action, context, aws):
+        """Test get_connection is called when the listing has no props."""
+        aws.conns.return_value = {
+            "my-s3": {"connectionId": "conn-1", "error": "no details"}
+        }
+        aws.client.get_connection.return_value = {
+            "connectionId": "conn-1",
+            "environmentId": "env-2",
+            "props": S3_PROPS,
+        }
+
+        result = datazone_handler.create_connection(action, context)
+
+        assert result["status"] == "unchanged"
+        aws.client.get_connection.assert_called_once_with(
+            domainIdentifier="domain-123", identifier="conn-1"
+        )
+
+    def test_messages_echoed_as_they_happen(self, action, context, aws):
+        """Test messages are echoed before the blocking create returns."""
+        aws.conns.return_value = {}
+        echoed = []
+
+        def create(**kwargs):
+            # The "Creating" line is out before the blocking create returns
+            assert len(echoed) == 1
+            return "conn-1"
+
+        aws.creator.create_connection.side_effect = create
+
+        with patch.object(
+            datazone_handler.typer, "echo", side_effect=echoed.append
+        ) as mock_echo:
+            datazone_handler.create_connection(action, context)
+
+        assert echoed[0].startswith("🔗 Creating S3 connection 'my-s3'")
+        assert mock_echo.call_count == 2
+
+    def test_creates_missing_connection(self, action, context, aws):
+        """Test a connection missing from the listing is created."""
+        aws.conns.return_value = {}
+        aws.creator.create_connection.return_value = "conn-new"
+
+        result = datazone_handler.create_connection(action, context)
+
+        assert result == {
+            "action": "datazone.create_connection",
+            "status": "created",
+            "connection_id": "conn-new",
+        }
+        aws.creator.create_connection.assert_called_once_with(
+            environment_id="env-1",
+            name="my-s3",
+            connection_type="S3",
+            echo=datazone_handler.typer.echo,
+            s3_uri="s3://bucket/data/",
+        )
+
+
+class TestHandleDatazoneActions:
+    """Tests for batched connection actions."""
+
+    def test_lists_connections_once_for_batch(self, context, aws):
+        """Test a batch lists project connections only once."""
+        aws.conns.return_value = {}
+        aws.creator.create_connection.side_effect = ["conn-a", "conn-b"]
+        actions = s3_actions("a", "b")
+
+        results = datazone_handler.handle_datazone_actions(actions, context)
+
+        assert [r["status"] for r in results] == ["created", "created"]
+        aws.conns.assert_called_once_with(
+            "project-123", "domain-123", "us-east-1", include_props=True
+        )
+        cached = context["_connection_cache"][
+            ("project-123", "domain-123", "us-east-1")
+        ]
+        assert set(cached) == {"a", "b"}
+
+    def test_raises_first_failure(self, context, aws):
+        """Test a failing action's exception is re-raised."""
+        aws.conns.return_value = {}
+        aws.creator.create_connection.side_effect = Exception("boom")
+        actions = s3_actions("a", "a")
+
+        with pytest.raises(Exception, match="boom"):
+            datazone_handler.handle_datazone_actions(actions, context)
+
+    def test_same_name_actions_run_in_order(self, context, aws):
+        """Test actions for one connection name run in order."""
+        aws.conns.return_value = {}
+        # Slow create so a concurrent duplicate would also miss the cache
+        aws.creator.create_connection.side_effect = lambda **kwargs: (
+            time.sleep(0.05) or "conn-a"
+        )
+        actions = s3_actions("a", "a")
+
+        results = datazone_handler.handle_datazone_actions(actions, context)
+
+        assert [r["status"] for r in results] == ["created", "unchanged"]
+        aws.creator.create_connection.assert_called_once()
+
+    def test_no_new_actions_start_after_failure(self, context, aws):
+        """Test no further actions start after one fails."""
+        aws.conns.return_value = {}
+        aws.creator.create_connection.side_effect = Exception("boom")
+        actions = s3_actions("a", "b", "c")
+
+        with patch.object(datazone_handler, "MAX_CONNECTION_WORKERS", 1):
+            with pytest.raises(Exception, match="boom"):
+                datazone_handler.handle_datazone_actions(actions, context)
+
+        aws.creator.create_connection.assert_called_once()
+
+    def test_messages_echoed_once_per_action_in_batch(self, context, aws):
+        """Test batched actions echo their messages in one write."""
+        aws.conns.return_value = {
+            "a": {"connectionId": "conn-a", "props": {"old": True}},
+        }
+
+        def update(name, connection_id, echo, **kwargs):
+            echo(f"🔄 Updating connection '{name}'")
+            return connection_id
+
+        aws.creator.update_connection.side_effect = update
+        actions = s3_actions("a")
+
+        with patch.object(datazone_handler.typer, "echo") as mock_echo:
+            datazone_handler.handle_datazone_actions(actions, context)
+
+        mock_echo.assert_called_once_with(
+            "🔍 Connection 'a' exists: conn-a\n🔄 Updating connection 'a'"
+        )
+
+    def test_creator_built_before_workers_start(self, context, aws):
+        """Test the ConnectionCreator is built on the calling thread."""
+        aws.conns.return_value = {}
+        aws.creator.create_connection.return_value = "conn"
+        threads = []
+        datazone_handler._connection_creator.side_effect = lambda *args: (
+            threads.append(threading.current_thread()) or aws.creator
+        )
+        actions = s3_actions("a", "b")
+
+        datazone_handler.handle_datazone_actions(actions, context)
+
+        assert threads[0] is threading.main_thread()
+
+
+class TestPropsFingerprint:
+    """Tests for the debug-log props fingerprint."""
+
+    def test_ignores_key_order(self):
+        """Test key order does not change the fingerprint."""
+        first = {"a": 1, "b": {"c": 2, "d": 3}}
+        second = {"b": {"d": 3, "c": 2}, "a": 1}
+
+        assert datazone_handler._props_fingerprint(
+            first
+        ) == datazone_handler._props_fingerprint(second)
+
+    def test_rejects_non_json_values(self):
+        """Test non-JSON values raise instead of hashing as strings."""
+        with pytest.raises(TypeError):
+            datazone_handler._props_fingerprint({"when": object()})
+
+
+class TestProjectEnvironmentCache:
+    """Tests for per-run environment caching."""
+
+    def test_environments_listed_once_per_project(self, action, context, aws):
+        """Test environments are listed once per project per run."""
+        aws.conns.return_value = {"my-s3": {"connectionId": "c", "props": S3_PROPS}}
+
+        datazone_handler.create_connection(action, context)
+        datazone_handler.create_connection(action, context)
+
+        datazone_handler.datazone.get_project_environments.assert_called_once_with(
+            "project-123", "domain-123", "us-east-1"
+        )
+
+    def test_empty_environments_not_cached(self, context):
+        """Test an empty environment lookup is not cached."""
+        with patch.object(
+            datazone_handler.datazone, "get_project_environments", return_value=[]
+        ) as mock_envs:
+            for _ in range(2):
+                assert (
+                    datazone_handler._get_project_environments(
+                        context, "project-123", "domain-123", "us-east-1"
+                    )
+                    == []
+                )
+
+        assert mock_envs.call_count == 2
+
+
+class TestConnectionCreatorCache:
+    """Tests for the shared ConnectionCreator."""
+
+    def test_creator_built_once_per_domain_and_region(self):
+        """Test one ConnectionCreator is built per domain and region."""
+        datazone_handler._connection_creator.cache_clear()
+        try:
+            with patch.object(datazone_handler, "ConnectionCreator") as mock_cls:
+                first = datazone_handler._connection_creator("domain-123", "us-east-1")
+                second = datazone_handler._connection_creator("domain-123", "us-east-1")
+
+            assert first is second
+            mock_cls.assert_called_once_with(domain_id="domain-123", region="us-east-1")
+        finally:
+            datazone_handler._connection_creator.cache_clear()
+
+    def test_internal_client_built_once_across_threads(self):
+        """Test concurrent callers share one internal client."""
+        with patch.object(
+            connection_creator,
+            "create_session_client",
+            side_effect=lambda *args, **kwargs: time.sleep(0.05) or MagicMock(),
+        ) as mock_create:
+            creator = connection_creator.ConnectionCreator("domain-123", "us-east-1")
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                clients = list(
+                    executor.map(
+                        lambda _: creator._get_internal_datazone_client(), range(8)
+                    )
+                )
+
+        assert all(client is clients[0] for client in clients)
+        # One standard client at init, one internal client on first use
+        assert mock_create.call_count == 2
+
+
+class TestHandleDatazoneAction:
+    """Tests for DataZone/Project action dispatch."""
+
+    def test_routes_create_environment(self):
+        """Test project.create_environment is dispatched."""
+        result = datazone_handler.handle_datazone_action(
+            BootstrapAction(type="project.create_environment"), {}
+        )
+
+        assert result["action"] == "project.create_environment"
+
+    def test_unknown_action(self):
+        """Test an unknown action raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown DataZone/Project action: bogus"):
+            datazone_handler.handle_datazone_action(
+                BootstrapAction(type="datazone.bogus"), {}
+            )
@@ -0,0 +1,34 @@
+"""Unit tests for shared boto3 session clients."""
+
+from unittest.mock import patch
+
+from smus_cicd.helpers import boto3_client
+
+
+class TestCreateSessionClient:
+    """Test client creation from the shared session."""
+
+    def test_client_built_from_shared_session_with_client_config(self):
+        """Test clients come from get_session() with CLIENT_CONFIG."""
+        with patch.object(boto3_client, "get_session") as mock_session:
+            boto3_client.create_session_client(
+                "datazone-internal", "us-east-1", endpoint_url="https://dz.test"
+            )
+
+        mock_session.return_value.client.assert_called_once_with(
+            "datazone-internal",
+            region_name="us-east-1",
+            config=boto3_client.CLIENT_CONFIG,
+            endpoint_url="https://dz.test",
+        )
+
+
+class TestGetSessionCredentials:
+    """Test credential lookup from the shared session."""
+
+    def test_credentials_come_from_shared_session(self):
+        """Test credentials are read from get_session(), not a new session."""
+        with patch.object(boto3_client, "get_session") as mock_session:
+            credentials = boto3_client.get_session_credentials()
+
+        assert credentials is mock_session.return_value.get_credentials.return_value
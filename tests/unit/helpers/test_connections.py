@@ -0,0 +1,25 @@
+"""Unit tests for connection property extraction."""
+
+from smus_cicd.helpers.connections import extract_connection_properties
+
+CONNECTION_DETAIL = {
+    "connectionId": "conn-1",
+    "type": "S3",
+    "environmentId": "env-1",
+    "props": {"s3Properties": {"s3Uri": "s3://bucket/prefix/"}},
+}
+
+
+class TestExtractConnectionProperties:
+    """Test extract_connection_properties."""
+
+    def test_raw_props_omitted_by_default(self):
+        """Test raw props stay out of the public connection info."""
+        conn_info = extract_connection_properties(CONNECTION_DETAIL)
+        assert "props" not in conn_info
+        assert conn_info["s3Uri"] == "s3://bucket/prefix/"
+
+    def test_raw_props_included_on_request(self):
+        """Test include_props keeps the raw props for state comparison."""
+        conn_info = extract_connection_properties(CONNECTION_DETAIL, include_props=True)
+        assert conn_info["props"] == CONNECTION_DETAIL["props"]